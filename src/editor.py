@@ -1,8 +1,12 @@
 """Core text editor widget."""
 
+from os.path import basename
+
 from PyQt6.QtWidgets import QPlainTextEdit
 from PyQt6.QtGui import QFont, QKeyEvent, QTextCursor
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QFile, QIODevice, QSaveFile, QSignalBlocker, QTimer, pyqtSignal
+)
 
 
 class TextEditor(QPlainTextEdit):
@@ -11,9 +15,17 @@ class TextEditor(QPlainTextEdit):
     modification_changed = pyqtSignal(bool)
     cursor_position_changed = pyqtSignal(int, int)
     
+    # Minimum interval between cursor position reports (~30 per second)
+    CURSOR_REPORT_INTERVAL_MS = 33
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._file_path = None
+        self._display_name = "Untitled"
+        self._is_modified = False
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(self.CURSOR_REPORT_INTERVAL_MS)
         self._setup_editor()
         self._connect_signals()
     
@@ -27,8 +39,20 @@ class TextEditor(QPlainTextEdit):
     
     def _connect_signals(self):
         """Connect internal signals."""
-        self.document().modificationChanged.connect(self.modification_changed.emit)
-        self.cursorPositionChanged.connect(self._emit_cursor_position)
+        self.document().modificationChanged.connect(self._on_modification_changed)
+        self.cursorPositionChanged.connect(self._schedule_cursor_position)
+        self._cursor_timer.timeout.connect(self._emit_cursor_position)
+    
+    def _on_modification_changed(self, modified: bool):
+        """Track the modification state and re-emit it."""
+        self._is_modified = modified
+        self.modification_changed.emit(modified)
+    
+    def _schedule_cursor_position(self):
+        """Report the cursor position at most once per interval."""
+        # Not restarted while pending, so held-down keys still get updates
+        if not self._cursor_timer.isActive():
+            self._cursor_timer.start()
     
     def _emit_cursor_position(self):
         """Emit cursor position as line and column."""
@@ -46,11 +70,15 @@ class TextEditor(QPlainTextEdit):
     def file_path(self, path):
         """Set the file path associated with this editor."""
         self._file_path = path
+        if path:
+            self._display_name = basename(path)
+        else:
+            self._display_name = "Untitled"
     
     @property
     def is_modified(self):
         """Check if the document has been modified."""
-        return self.document().isModified()
+        return self._is_modified
     
     def set_modified(self, modified: bool):
         """Set the modification state."""
@@ -58,35 +86,76 @@ class TextEditor(QPlainTextEdit):
     
     def get_display_name(self):
         """Get a display name for this editor tab."""
-        if self._file_path:
-            from pathlib import Path
-            return Path(self._file_path).name
-        return "Untitled"
+        return self._display_name
     
     def load_file(self, file_path: str) -> bool:
         """Load content from a file."""
+        # Read in one Qt call, then decode strictly so files that are not
+        # UTF-8 are refused rather than loaded with replacement characters.
+        # Text mode would drop every \r, so line endings are normalised
+        # here the way Python's universal newlines do.
+        qfile = QFile(file_path)
+        if not qfile.open(QIODevice.OpenModeFlag.ReadOnly):
+            return False
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.setPlainText(f.read())
-            self._file_path = file_path
-            self.document().setModified(False)
-            return True
-        except (IOError, OSError) as e:
+            data = bytes(qfile.readAll())
+        finally:
+            qfile.close()
+        try:
+            text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        except UnicodeDecodeError:
             return False
+        # Loading fires text, cursor and modification signals several times;
+        # hold the editor's own signals and report the final state once.
+        # The document itself is not blocked, so the layout stays in sync.
+        with QSignalBlocker(self):
+            self.setPlainText(text)
+            self.file_path = file_path
+            self.document().setModified(False)
+        self._cursor_timer.stop()
+        self._emit_cursor_position()
+        self.modification_changed.emit(False)
+        return True
     
     def save_file(self, file_path: str = None) -> bool:
         """Save content to a file."""
         path = file_path or self._file_path
         if not path:
             return False
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(self.toPlainText())
-            self._file_path = path
-            self.document().setModified(False)
-            return True
-        except (IOError, OSError) as e:
+        # Encode once and write in a single call; QSaveFile writes to a
+        # temporary file and renames it over the target on commit, so a
+        # failed save never leaves a truncated file behind. Where no
+        # temporary file can be created it writes the target in place.
+        qfile = QSaveFile(path)
+        qfile.setDirectWriteFallback(True)
+        if not qfile.open(QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Text):
             return False
+        data = self.toPlainText().encode('utf-8')
+        if qfile.write(data) != len(data):
+            qfile.cancelWriting()
+            return False
+        if not qfile.commit():
+            return False
+        self.file_path = path
+        self.document().setModified(False)
+        return True
+    
+    def replace_text(self, new_text: str):
+        """Replace the whole text as a single undo step, keeping the view."""
+        position = self.textCursor().position()
+        scroll = self.verticalScrollBar().value()
+        
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        cursor.select(QTextCursor.SelectionType.Document)
+        cursor.insertText(new_text)
+        cursor.endEditBlock()
+        
+        # Clamp in document positions (UTF-16 units), not Python characters
+        last = self.document().characterCount() - 1
+        cursor.setPosition(min(position, last))
+        self.setTextCursor(cursor)
+        self.verticalScrollBar().setValue(scroll)
     
     def duplicate_line(self):
         """Duplicate the current line or selection."""
@@ -96,56 +165,65 @@ class TextEditor(QPlainTextEdit):
             cursor.clearSelection()
             cursor.insertText(text)
         else:
-            cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-            line_text = cursor.selectedText()
-            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock)
-            cursor.insertText('\n' + line_text)
+            block = cursor.block()
+            cursor.setPosition(block.position() + block.length() - 1)
+            cursor.insertText('\n' + block.text())
         self.setTextCursor(cursor)
     
     def delete_line(self):
         """Delete the current line."""
         cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-        cursor.movePosition(QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor)
-        if cursor.atEnd():
-            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-            cursor.movePosition(QTextCursor.MoveOperation.PreviousCharacter, QTextCursor.MoveMode.KeepAnchor)
+        block = cursor.block()
+        start = block.position()
+        next_block = block.next()
+        if next_block.isValid():
+            end = next_block.position()
+        else:
+            # Last line: remove the newline before it instead of after it
+            end = start + block.length() - 1
+            start = max(start - 1, 0)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
         cursor.removeSelectedText()
         self.setTextCursor(cursor)
     
     def move_line_up(self):
         """Move the current line up."""
         cursor = self.textCursor()
-        if cursor.blockNumber() == 0:
+        block = cursor.block()
+        previous = block.previous()
+        if not previous.isValid():
             return
+        # Swap both lines with a single replacement of their combined range
+        start = previous.position()
+        end = block.position() + block.length() - 1
+        column = cursor.positionInBlock()
         cursor.beginEditBlock()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-        line_text = cursor.selectedText()
-        cursor.removeSelectedText()
-        cursor.deletePreviousChar()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-        cursor.insertText(line_text + '\n')
-        cursor.movePosition(QTextCursor.MoveOperation.PreviousBlock)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(block.text() + '\n' + previous.text())
         cursor.endEditBlock()
+        cursor.setPosition(start + column)
         self.setTextCursor(cursor)
     
     def move_line_down(self):
         """Move the current line down."""
         cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock)
-        if cursor.atEnd():
+        block = cursor.block()
+        next_block = block.next()
+        if not next_block.isValid():
             return
+        # Swap both lines with a single replacement of their combined range
+        start = block.position()
+        end = next_block.position() + next_block.length() - 1
+        column = cursor.positionInBlock()
+        moved_to = start + next_block.length()
         cursor.beginEditBlock()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-        line_text = cursor.selectedText()
-        cursor.removeSelectedText()
-        cursor.deleteChar()
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock)
-        cursor.insertText('\n' + line_text)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(next_block.text() + '\n' + block.text())
         cursor.endEditBlock()
+        cursor.setPosition(moved_to + column)
         self.setTextCursor(cursor)
     
     def select_word(self):
@@ -169,7 +247,9 @@ class TextEditor(QPlainTextEdit):
     
     def go_to_line(self, line_number: int):
         """Go to a specific line number."""
-        block = self.document().findBlockByLineNumber(line_number - 1)
+        # Lines never wrap, so each line is one block; the block lookup
+        # runs in C++ and needs no table rebuilt after every edit
+        block = self.document().findBlockByNumber(line_number - 1)
         if block.isValid():
             cursor = self.textCursor()
             cursor.setPosition(block.position())
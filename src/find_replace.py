@@ -1,11 +1,18 @@
 """Find and replace functionality."""
 
+import re
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
     QPushButton, QLabel, QCheckBox
 )
 from PyQt6.QtGui import QTextCursor, QTextDocument
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QRegularExpression, QTimer, pyqtSignal
+
+
+# Like FindWholeWords: no letter or digit directly on either side; unlike
+# \w, an underscore separates words. Valid for both re and QRegularExpression.
+_WHOLE_WORD_PATTERN = r'(?<![^\W_])%s(?![^\W_])'
 
 
 class FindReplaceWidget(QWidget):
@@ -13,12 +20,25 @@ class FindReplaceWidget(QWidget):
     
     closed = pyqtSignal()
     
+    # Delay before a changed search text is searched, so typing a query
+    # rescans the document once instead of once per keystroke
+    SEARCH_DELAY_MS = 150
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._editor = None
         self._last_match_position = -1
+        self._last_match_start = -1
+        self._cached_text = None
+        self._pattern_key = None
+        self._pattern = None
+        self._regex = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
         self._setup_ui()
         self._connect_signals()
+        self._rebuild_find_flags()
         self.hide()
     
     def _setup_ui(self):
@@ -74,11 +94,58 @@ class FindReplaceWidget(QWidget):
         self.close_btn.clicked.connect(self._close)
         self.find_input.returnPressed.connect(self.find_next)
         self.find_input.textChanged.connect(self._on_search_text_changed)
+        self._search_timer.timeout.connect(self._on_search_settled)
+        self.case_sensitive_cb.toggled.connect(self._rebuild_find_flags)
+        self.whole_word_cb.toggled.connect(self._rebuild_find_flags)
     
     def set_editor(self, editor):
         """Set the editor to search in."""
+        if editor is not self._editor:
+            if self._editor:
+                try:
+                    self._editor.document().contentsChange.disconnect(self._invalidate_text_cache)
+                    self._editor.cursorPositionChanged.disconnect(self._reset_match_anchor)
+                except RuntimeError:
+                    # The previous editor was already deleted with its tab
+                    pass
+            if editor:
+                editor.document().contentsChange.connect(self._invalidate_text_cache)
+                editor.cursorPositionChanged.connect(self._reset_match_anchor)
         self._editor = editor
+        self._cached_text = None
+        self._reset_match_anchor()
+        self._search_timer.stop()
+    
+    def _invalidate_text_cache(self, *args):
+        """Drop the cached document text and match anchor after an edit."""
+        self._cached_text = None
+        self._reset_match_anchor()
+    
+    def _reset_match_anchor(self):
+        """Forget the last match once the editor's cursor has moved away."""
         self._last_match_position = -1
+        self._last_match_start = -1
+    
+    def _search_cursor(self, anchor: int):
+        """Get a cursor to search from, preferring the last match anchor."""
+        if anchor < 0:
+            return self._editor.textCursor()
+        # A bare cursor spares Qt from copying the editor's cursor and selection
+        cursor = QTextCursor(self._editor.document())
+        cursor.setPosition(anchor)
+        return cursor
+    
+    def _select_match(self, found: QTextCursor):
+        """Select a match in the editor and remember it as the next anchor."""
+        self._editor.setTextCursor(found)
+        self._last_match_position = found.position()
+        self._last_match_start = found.selectionStart()
+    
+    def _get_text(self):
+        """Get the editor's plain text, reusing it until the document changes."""
+        if self._cached_text is None:
+            self._cached_text = self._editor.toPlainText()
+        return self._cached_text
     
     def show_find(self):
         """Show the find bar and focus the input."""
@@ -92,6 +159,8 @@ class FindReplaceWidget(QWidget):
     
     def _close(self):
         """Close the find/replace bar."""
+        self._search_timer.stop()
+        self._cached_text = None
         self.hide()
         self.closed.emit()
         if self._editor:
@@ -99,24 +168,71 @@ class FindReplaceWidget(QWidget):
     
     def _on_search_text_changed(self, text):
         """Handle search text changes."""
-        self._last_match_position = -1
-        self._update_match_count()
-        # Automatically find first match when text changes
+        self._reset_match_anchor()
         if text:
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self.match_label.setText("")
+    
+    def _on_search_settled(self):
+        """Count matches and jump to the first one once typing pauses."""
+        self._update_match_count()
+        # Automatically find first match unless the user already navigated
+        if self._editor and self.find_input.text() and self._last_match_position == -1:
             # Move cursor to start of document to find first occurrence
-            if self._editor:
-                cursor = QTextCursor(self._editor.document())
-                self._editor.setTextCursor(cursor)
-                self.find_next()
+            cursor = QTextCursor(self._editor.document())
+            self._editor.setTextCursor(cursor)
+            self.find_next()
     
-    def _get_find_flags(self):
-        """Get the find flags based on options."""
+    def _rebuild_find_flags(self, *args):
+        """Recompute the find flags after an option checkbox changes."""
         flags = QTextDocument.FindFlag(0)
         if self.case_sensitive_cb.isChecked():
             flags |= QTextDocument.FindFlag.FindCaseSensitively
         if self.whole_word_cb.isChecked():
             flags |= QTextDocument.FindFlag.FindWholeWords
-        return flags
+        self._find_flags = flags
+    
+    def _find_query(self):
+        """Get the query and flags to pass to QTextDocument.find."""
+        # Plain-string find is fastest when case matters; without it, Qt
+        # folds case per character and a compiled regex scans faster
+        text = self.find_input.text()
+        if self.case_sensitive_cb.isChecked():
+            return text, self._find_flags
+        return self._build_regex(), QTextDocument.FindFlag(0)
+    
+    def _build_pattern(self):
+        """Compile the search text into a regex honoring the find options."""
+        self._compile_patterns()
+        return self._pattern
+    
+    def _build_regex(self):
+        """Get the search text as a QRegularExpression honoring the options."""
+        self._compile_patterns()
+        return self._regex
+    
+    def _compile_patterns(self):
+        """Recompile the search regexes when the query or an option changed."""
+        text = self.find_input.text()
+        case_sensitive = self.case_sensitive_cb.isChecked()
+        whole_word = self.whole_word_cb.isChecked()
+        
+        key = (text, case_sensitive, whole_word)
+        if key == self._pattern_key:
+            return
+        pattern = re.escape(text)
+        regex = QRegularExpression.escape(text)
+        if whole_word:
+            pattern = _WHOLE_WORD_PATTERN % pattern
+            regex = _WHOLE_WORD_PATTERN % regex
+        self._pattern = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+        options = QRegularExpression.PatternOption.UseUnicodePropertiesOption
+        if not case_sensitive:
+            options |= QRegularExpression.PatternOption.CaseInsensitiveOption
+        self._regex = QRegularExpression(regex, options)
+        self._pattern_key = key
     
     def _update_match_count(self):
         """Update the match count label."""
@@ -125,37 +241,43 @@ class FindReplaceWidget(QWidget):
             return
         
         text = self.find_input.text()
-        document = self._editor.document()
-        flags = self._get_find_flags()
+        doc_text = self._get_text()
         
-        count = 0
-        cursor = QTextCursor(document)
-        while True:
-            cursor = document.find(text, cursor, flags)
-            if cursor.isNull():
-                break
-            count += 1
+        # Counting needs no cursors, so scan the plain text in C instead of
+        # stepping through QTextDocument.find()
+        if not self._may_match(doc_text):
+            count = 0
+        elif self.case_sensitive_cb.isChecked() and not self.whole_word_cb.isChecked():
+            count = doc_text.count(text)
+        else:
+            count = sum(1 for _ in self._build_pattern().finditer(doc_text))
         
         self.match_label.setText(f"{count} matches")
     
+    def _may_match(self, doc_text):
+        """Cheaply rule out a document that cannot contain any match."""
+        # A case-sensitive query must occur literally, whole word or not;
+        # lowering the document to probe case-insensitively would cost a copy
+        if self.case_sensitive_cb.isChecked():
+            return self.find_input.text() in doc_text
+        return True
+    
     def find_next(self):
         """Find the next occurrence."""
         if not self._editor or not self.find_input.text():
             return False
         
-        text = self.find_input.text()
-        flags = self._get_find_flags()
+        query, flags = self._find_query()
         
-        cursor = self._editor.textCursor()
-        found = self._editor.document().find(text, cursor, flags)
+        cursor = self._search_cursor(self._last_match_position)
+        found = self._editor.document().find(query, cursor, flags)
         
         if found.isNull():
             cursor = QTextCursor(self._editor.document())
-            found = self._editor.document().find(text, cursor, flags)
+            found = self._editor.document().find(query, cursor, flags)
         
         if not found.isNull():
-            self._editor.setTextCursor(found)
-            self._last_match_position = found.position()
+            self._select_match(found)
             return True
         return False
     
@@ -164,20 +286,19 @@ class FindReplaceWidget(QWidget):
         if not self._editor or not self.find_input.text():
             return False
         
-        text = self.find_input.text()
-        flags = self._get_find_flags() | QTextDocument.FindFlag.FindBackward
+        query, flags = self._find_query()
+        flags |= QTextDocument.FindFlag.FindBackward
         
-        cursor = self._editor.textCursor()
-        found = self._editor.document().find(text, cursor, flags)
+        cursor = self._search_cursor(self._last_match_start)
+        found = self._editor.document().find(query, cursor, flags)
         
         if found.isNull():
             cursor = QTextCursor(self._editor.document())
             cursor.movePosition(QTextCursor.MoveOperation.End)
-            found = self._editor.document().find(text, cursor, flags)
+            found = self._editor.document().find(query, cursor, flags)
         
         if not found.isNull():
-            self._editor.setTextCursor(found)
-            self._last_match_position = found.position()
+            self._select_match(found)
             return True
         return False
     
@@ -209,21 +330,28 @@ class FindReplaceWidget(QWidget):
         
         text = self.find_input.text()
         replacement = self.replace_input.text()
-        flags = self._get_find_flags()
+        source = self._get_text()
+        if not self._may_match(source):
+            self.match_label.setText("0 matches")
+            return 0
         
-        cursor = QTextCursor(self._editor.document())
-        cursor.beginEditBlock()
-        
-        count = 0
-        while True:
-            found = self._editor.document().find(text, cursor, flags)
-            if found.isNull():
-                break
-            found.insertText(replacement)
-            cursor = found
-            count += 1
-        
-        cursor.endEditBlock()
+        # Rewrite the whole text in one C-level pass instead of a
+        # find/insertText round-trip per match
+        if self.case_sensitive_cb.isChecked() and not self.whole_word_cb.isChecked():
+            count = source.count(text)
+            new_text = source.replace(text, replacement)
+        else:
+            # Escape backslashes so the replacement is inserted literally
+            new_text, count = self._build_pattern().subn(
+                replacement.replace('\\', '\\\\'), source
+            )
+        
+        if count:
+            self._editor.replace_text(new_text)
+            # Count the rewritten text without copying it back out of Qt;
+            # non-printable replacements may not round-trip (e.g. U+00A0)
+            if replacement.isprintable():
+                self._cached_text = new_text
         self._update_match_count()
         return count
     
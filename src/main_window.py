@@ -1,28 +1,120 @@
 """Main application window."""
 
-import sys
-from pathlib import Path
+import weakref
+from operator import attrgetter
 
 from PyQt6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QStatusBar,
-    QMenuBar, QMenu, QMessageBox, QInputDialog
+    QMenu, QMessageBox, QInputDialog
 )
-from PyQt6.QtGui import QAction, QKeySequence, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QAction, QKeySequence
+from PyQt6.QtCore import Qt, pyqtSlot
 
 from .split_container import SplitContainer
 from .find_replace import FindReplaceWidget
 from .multi_file_find import MultiFileFindDialog
 
+# Parsed once at import rather than for every window
+_KS_CLOSE_TAB = QKeySequence("Ctrl+W")
+_KS_CLOSE_ALL = QKeySequence("Ctrl+Shift+W")
+_KS_SELECT_WORD = QKeySequence("Ctrl+D")
+_KS_SELECT_LINE = QKeySequence("Ctrl+L")
+_KS_DUPLICATE_LINE = QKeySequence("Ctrl+Shift+D")
+_KS_DELETE_LINE = QKeySequence("Ctrl+Shift+K")
+_KS_MOVE_LINE_UP = QKeySequence("Alt+Up")
+_KS_MOVE_LINE_DOWN = QKeySequence("Alt+Down")
+_KS_FIND_NEXT = QKeySequence("F3")
+_KS_FIND_PREVIOUS = QKeySequence("Shift+F3")
+_KS_FIND_IN_FILES = QKeySequence("Ctrl+Shift+F")
+_KS_GO_TO_LINE = QKeySequence("Ctrl+G")
+_KS_SPLIT_RIGHT = QKeySequence("Ctrl+\\")
+_KS_SPLIT_DOWN = QKeySequence("Ctrl+Shift+\\")
+_KS_CLOSE_SPLIT = QKeySequence("Ctrl+Shift+X")
+_KS_FOCUS_NEXT_SPLIT = QKeySequence("Ctrl+Alt+Right")
+_KS_FOCUS_PREVIOUS_SPLIT = QKeySequence("Ctrl+Alt+Left")
+_KS_NEXT_TAB = QKeySequence("Ctrl+Tab")
+_KS_PREVIOUS_TAB = QKeySequence("Ctrl+Shift+Tab")
+
+_ABOUT_TEXT = (
+    "TextEdit\n\n"
+    "A simple cross-platform text editor built with PyQt6.\n\n"
+    "Features:\n"
+    "• Multi-file editing with tabs\n"
+    "• Split views (horizontal and vertical)\n"
+    "• Find and replace\n"
+    "• Multi-file find and replace\n"
+    "• Line manipulation shortcuts\n"
+    "• Cursor position tracking"
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    _MENU_SPEC = (
+        ("&File", (
+            ("&New", attrgetter("split_container.new_tab"), QKeySequence.StandardKey.New),
+            ("&Open...", attrgetter("split_container.open_file"), QKeySequence.StandardKey.Open),
+            None,
+            ("&Save", attrgetter("split_container.save_current"), QKeySequence.StandardKey.Save),
+            ("Save &As...", attrgetter("split_container.save_current_as"), QKeySequence.StandardKey.SaveAs),
+            None,
+            ("&Close Tab", attrgetter("split_container.close_current_tab"), _KS_CLOSE_TAB),
+            ("Close &All", attrgetter("split_container.close_all_tabs"), _KS_CLOSE_ALL),
+            None,
+            ("E&xit", attrgetter("close"), QKeySequence.StandardKey.Quit),
+        )),
+        ("&Edit", (
+            ("&Undo", attrgetter("_undo"), QKeySequence.StandardKey.Undo),
+            ("&Redo", attrgetter("_redo"), QKeySequence.StandardKey.Redo),
+            None,
+            ("Cu&t", attrgetter("_cut"), QKeySequence.StandardKey.Cut),
+            ("&Copy", attrgetter("_copy"), QKeySequence.StandardKey.Copy),
+            ("&Paste", attrgetter("_paste"), QKeySequence.StandardKey.Paste),
+            None,
+            ("Select &All", attrgetter("_select_all"), QKeySequence.StandardKey.SelectAll),
+            ("Select &Word", attrgetter("_select_word"), _KS_SELECT_WORD),
+            ("Select &Line", attrgetter("_select_line"), _KS_SELECT_LINE),
+            None,
+            ("Duplicate Line", attrgetter("_duplicate_line"), _KS_DUPLICATE_LINE),
+            ("Delete Line", attrgetter("_delete_line"), _KS_DELETE_LINE),
+            ("Move Line Up", attrgetter("_move_line_up"), _KS_MOVE_LINE_UP),
+            ("Move Line Down", attrgetter("_move_line_down"), _KS_MOVE_LINE_DOWN),
+        )),
+        ("&Search", (
+            ("&Find...", attrgetter("_show_find"), QKeySequence.StandardKey.Find),
+            ("Find &Next", attrgetter("_find_next"), _KS_FIND_NEXT),
+            ("Find &Previous", attrgetter("_find_previous"), _KS_FIND_PREVIOUS),
+            ("&Replace...", attrgetter("_show_find"), QKeySequence.StandardKey.Replace),
+            None,
+            ("Find in &Files...", attrgetter("_show_multi_file_find"), _KS_FIND_IN_FILES),
+        )),
+        ("&View", (
+            ("&Go to Line...", attrgetter("_go_to_line"), _KS_GO_TO_LINE),
+            None,
+            ("Split &Right", attrgetter("split_container.split_horizontal"), _KS_SPLIT_RIGHT),
+            ("Split &Down", attrgetter("split_container.split_vertical"), _KS_SPLIT_DOWN),
+            ("Close Split", attrgetter("split_container.close_split"), _KS_CLOSE_SPLIT),
+            None,
+            ("Focus Next Split", attrgetter("split_container.focus_next_split"), _KS_FOCUS_NEXT_SPLIT),
+            ("Focus Previous Split", attrgetter("split_container.focus_previous_split"), _KS_FOCUS_PREVIOUS_SPLIT),
+            None,
+            ("Next Tab", attrgetter("split_container.next_tab"), _KS_NEXT_TAB),
+            ("Previous Tab", attrgetter("split_container.previous_tab"), _KS_PREVIOUS_TAB),
+        )),
+        ("&Help", (
+            ("&About", attrgetter("_show_about"), None),
+        )),
+    )
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TextEdit")
         self.setMinimumSize(800, 600)
         self.resize(1200, 800)
+        self._current_editor = None
+        self._connected_editors = weakref.WeakSet()
+        self._mf_dialog = None
         
         self._setup_central_widget()
         self._setup_menu_bar()
@@ -47,59 +139,14 @@ class MainWindow(QMainWindow):
     def _setup_menu_bar(self):
         """Set up the menu bar."""
         menubar = self.menuBar()
-        
-        file_menu = menubar.addMenu("&File")
-        self._add_action(file_menu, "&New", self.split_container.new_tab, QKeySequence.StandardKey.New)
-        self._add_action(file_menu, "&Open...", self.split_container.open_file, QKeySequence.StandardKey.Open)
-        file_menu.addSeparator()
-        self._add_action(file_menu, "&Save", self.split_container.save_current, QKeySequence.StandardKey.Save)
-        self._add_action(file_menu, "Save &As...", self.split_container.save_current_as, QKeySequence.StandardKey.SaveAs)
-        file_menu.addSeparator()
-        self._add_action(file_menu, "&Close Tab", self.split_container.close_current_tab, QKeySequence("Ctrl+W"))
-        self._add_action(file_menu, "Close &All", self.split_container.close_all_tabs, QKeySequence("Ctrl+Shift+W"))
-        file_menu.addSeparator()
-        self._add_action(file_menu, "E&xit", self.close, QKeySequence.StandardKey.Quit)
-        
-        edit_menu = menubar.addMenu("&Edit")
-        self._add_action(edit_menu, "&Undo", self._undo, QKeySequence.StandardKey.Undo)
-        self._add_action(edit_menu, "&Redo", self._redo, QKeySequence.StandardKey.Redo)
-        edit_menu.addSeparator()
-        self._add_action(edit_menu, "Cu&t", self._cut, QKeySequence.StandardKey.Cut)
-        self._add_action(edit_menu, "&Copy", self._copy, QKeySequence.StandardKey.Copy)
-        self._add_action(edit_menu, "&Paste", self._paste, QKeySequence.StandardKey.Paste)
-        edit_menu.addSeparator()
-        self._add_action(edit_menu, "Select &All", self._select_all, QKeySequence.StandardKey.SelectAll)
-        self._add_action(edit_menu, "Select &Word", self._select_word, QKeySequence("Ctrl+D"))
-        self._add_action(edit_menu, "Select &Line", self._select_line, QKeySequence("Ctrl+L"))
-        edit_menu.addSeparator()
-        self._add_action(edit_menu, "Duplicate Line", self._duplicate_line, QKeySequence("Ctrl+Shift+D"))
-        self._add_action(edit_menu, "Delete Line", self._delete_line, QKeySequence("Ctrl+Shift+K"))
-        self._add_action(edit_menu, "Move Line Up", self._move_line_up, QKeySequence("Alt+Up"))
-        self._add_action(edit_menu, "Move Line Down", self._move_line_down, QKeySequence("Alt+Down"))
-        
-        search_menu = menubar.addMenu("&Search")
-        self._add_action(search_menu, "&Find...", self._show_find, QKeySequence.StandardKey.Find)
-        self._add_action(search_menu, "Find &Next", self._find_next, QKeySequence("F3"))
-        self._add_action(search_menu, "Find &Previous", self._find_previous, QKeySequence("Shift+F3"))
-        self._add_action(search_menu, "&Replace...", self._show_find, QKeySequence.StandardKey.Replace)
-        search_menu.addSeparator()
-        self._add_action(search_menu, "Find in &Files...", self._show_multi_file_find, QKeySequence("Ctrl+Shift+F"))
-        
-        view_menu = menubar.addMenu("&View")
-        self._add_action(view_menu, "&Go to Line...", self._go_to_line, QKeySequence("Ctrl+G"))
-        view_menu.addSeparator()
-        self._add_action(view_menu, "Split &Right", self.split_container.split_horizontal, QKeySequence("Ctrl+\\"))
-        self._add_action(view_menu, "Split &Down", self.split_container.split_vertical, QKeySequence("Ctrl+Shift+\\"))
-        self._add_action(view_menu, "Close Split", self.split_container.close_split, QKeySequence("Ctrl+Shift+X"))
-        view_menu.addSeparator()
-        self._add_action(view_menu, "Focus Next Split", self.split_container.focus_next_split, QKeySequence("Ctrl+Alt+Right"))
-        self._add_action(view_menu, "Focus Previous Split", self.split_container.focus_previous_split, QKeySequence("Ctrl+Alt+Left"))
-        view_menu.addSeparator()
-        self._add_action(view_menu, "Next Tab", self.split_container.next_tab, QKeySequence("Ctrl+Tab"))
-        self._add_action(view_menu, "Previous Tab", self.split_container.previous_tab, QKeySequence("Ctrl+Shift+Tab"))
-        
-        help_menu = menubar.addMenu("&Help")
-        self._add_action(help_menu, "&About", self._show_about)
+        for title, entries in self._MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                else:
+                    name, callback, shortcut = entry
+                    self._add_action(menu, name, callback(self), shortcut)
     
     def _add_action(self, menu: QMenu, name: str, callback, shortcut=None) -> QAction:
         """Add an action to a menu."""
@@ -118,127 +165,152 @@ class MainWindow(QMainWindow):
     
     def _connect_signals(self):
         """Connect signals."""
-        self.split_container.current_editor_changed.connect(self._on_editor_changed)
-        self.split_container.active_tabs_changed.connect(self._on_active_tabs_changed)
-        self.find_replace.closed.connect(self._on_find_closed)
+        # Everything lives on the GUI thread, so skip AutoConnection's thread check
+        direct = Qt.ConnectionType.DirectConnection
+        self.split_container.current_editor_changed.connect(self._on_editor_changed, direct)
+        self.split_container.active_tabs_changed.connect(self._on_active_tabs_changed, direct)
+        self.find_replace.closed.connect(self._on_find_closed, direct)
+        self._current_editor = self.split_container.current_editor()
     
+    @pyqtSlot(object)
     def _on_active_tabs_changed(self, tabs):
         """Handle active tab widget change."""
-        if tabs:
-            editor = tabs.current_editor()
-            if editor:
-                self.find_replace.set_editor(editor)
+        self._current_editor = tabs.current_editor() if tabs else None
+        if self._current_editor:
+            self.find_replace.set_editor(self._current_editor)
     
+    @pyqtSlot(object)
     def _on_editor_changed(self, editor):
         """Handle editor change."""
+        self._current_editor = editor
         if editor:
             self.find_replace.set_editor(editor)
-            try:
-                editor.cursor_position_changed.disconnect(self._update_cursor_position)
-            except:
-                pass
-            editor.cursor_position_changed.connect(self._update_cursor_position)
+            if editor not in self._connected_editors:
+                editor.cursor_position_changed.connect(
+                    self._update_cursor_position, Qt.ConnectionType.DirectConnection
+                )
+                self._connected_editors.add(editor)
             self._update_cursor_position(1, 1)
-            self._update_window_title()
+            self._update_window_title(editor)
     
+    @pyqtSlot(int, int)
     def _update_cursor_position(self, line: int, col: int):
         """Update status bar with cursor position."""
-        self.status_bar.showMessage(f"Line {line}, Column {col}")
+        # TextEditor already throttles these reports, so show each directly
+        self.status_bar.showMessage("Line %d, Column %d" % (line, col))
     
-    def _update_window_title(self):
+    def _update_window_title(self, editor=None):
         """Update window title."""
-        editor = self.split_container.current_editor()
+        if editor is None:
+            editor = self._current_editor
         if editor and editor.file_path:
             self.setWindowTitle(f"{editor.get_display_name()} - TextEdit")
         else:
             self.setWindowTitle("TextEdit")
     
+    @pyqtSlot()
     def _undo(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.undo()
     
+    @pyqtSlot()
     def _redo(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.redo()
     
+    @pyqtSlot()
     def _cut(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.cut()
     
+    @pyqtSlot()
     def _copy(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.copy()
     
+    @pyqtSlot()
     def _paste(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.paste()
     
+    @pyqtSlot()
     def _select_all(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.select_all()
     
+    @pyqtSlot()
     def _select_word(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.select_word()
     
+    @pyqtSlot()
     def _select_line(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.select_line()
     
+    @pyqtSlot()
     def _duplicate_line(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.duplicate_line()
     
+    @pyqtSlot()
     def _delete_line(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.delete_line()
     
+    @pyqtSlot()
     def _move_line_up(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.move_line_up()
     
+    @pyqtSlot()
     def _move_line_down(self):
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.move_line_down()
     
+    @pyqtSlot()
     def _show_find(self):
         """Show the find/replace bar."""
-        self.find_replace.set_editor(self.split_container.current_editor())
+        self.find_replace.set_editor(self._current_editor)
         self.find_replace.show_find()
     
+    @pyqtSlot()
     def _on_find_closed(self):
         """Handle find bar closed."""
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if editor:
             editor.setFocus()
     
+    @pyqtSlot()
     def _find_next(self):
         if self.find_replace.isVisible():
             self.find_replace.find_next()
         else:
             self._show_find()
     
+    @pyqtSlot()
     def _find_previous(self):
         if self.find_replace.isVisible():
             self.find_replace.find_previous()
         else:
             self._show_find()
     
+    @pyqtSlot()
     def _go_to_line(self):
         """Show go to line dialog."""
-        editor = self.split_container.current_editor()
+        editor = self._current_editor
         if not editor:
             return
         
@@ -251,25 +323,20 @@ class MainWindow(QMainWindow):
         if ok:
             editor.go_to_line(line)
     
+    @pyqtSlot()
     def _show_about(self):
         """Show about dialog."""
-        QMessageBox.about(
-            self, "About TextEdit",
-            "TextEdit\n\n"
-            "A simple cross-platform text editor built with PyQt6.\n\n"
-            "Features:\n"
-            "• Multi-file editing with tabs\n"
-            "• Split views (horizontal and vertical)\n"
-            "• Find and replace\n"
-            "• Multi-file find and replace\n"
-            "• Line manipulation shortcuts\n"
-            "• Cursor position tracking"
-        )
+        QMessageBox.about(self, "About TextEdit", _ABOUT_TEXT)
     
+    @pyqtSlot()
     def _show_multi_file_find(self):
         """Show the multi-file find dialog."""
-        dialog = MultiFileFindDialog(self.split_container, self)
-        dialog.exec()
+        if self._mf_dialog is None:
+            self._mf_dialog = MultiFileFindDialog(self.split_container, self)
+        else:
+            # Results from the last search may no longer match the files
+            self._mf_dialog.clear_results()
+        self._mf_dialog.exec()
     
     def closeEvent(self, event):
         """Handle window close."""
@@ -1,5 +1,6 @@
 """Multi-file find and replace functionality."""
 
+import os
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
@@ -24,11 +25,25 @@ class SearchResult:
 class MultiFileFindDialog(QDialog):
     """Dialog for multi-file find and replace operations."""
     
+    # Common text file extensions searched in directory scope
+    SUPPORTED_EXTENSIONS = frozenset({
+        '.txt', '.py', '.js', '.java', '.cpp', '.c', '.h', '.hpp',
+        '.css', '.html', '.xml', '.json', '.md', '.rst', '.yaml', '.yml'
+    })
+    # Same set as a tuple, so one C-level str.endswith call checks them all
+    _SUPPORTED_SUFFIXES = tuple(SUPPORTED_EXTENSIONS)
+    
+    # Match items shown per file before a "more" item is added
+    MAX_RESULTS_PER_FILE = 2000
+    # Match items built up front; later files are filled in when expanded
+    EAGER_RESULT_LIMIT = 5000
+    
     def __init__(self, split_container, parent=None):
         super().__init__(parent)
         self.split_container = split_container
         self.results = []
         self.file_results = {}
+        self._untitled_paths = set()
         
         self.setWindowTitle("Find in Files")
         self.setMinimumSize(800, 600)
@@ -144,6 +159,7 @@ class MultiFileFindDialog(QDialog):
         self.browse_btn.clicked.connect(self._browse_directory)
         self.directory_radio.toggled.connect(self._on_scope_changed)
         self.results_tree.itemDoubleClicked.connect(self._on_result_double_clicked)
+        self.results_tree.itemExpanded.connect(self._on_result_expanded)
         self.find_input.returnPressed.connect(self.find_all)
     
     def _on_scope_changed(self, checked):
@@ -166,9 +182,7 @@ class MultiFileFindDialog(QDialog):
             self.status_label.setText("Please enter search text")
             return
         
-        self.results_tree.clear()
-        self.results = []
-        self.file_results = {}
+        self.clear_results()
         
         if self.open_tabs_radio.isChecked():
             files_to_search = self._get_open_tabs()
@@ -196,21 +210,35 @@ class MultiFileFindDialog(QDialog):
         else:
             self.status_label.setText("No matches found")
     
+    def _iter_open_editors(self):
+        """Yield the editor of every open tab."""
+        for tab_widget in self.split_container._get_all_tab_widgets():
+            for i in range(tab_widget.count()):
+                editor = tab_widget.widget(i)
+                if editor:
+                    yield editor
+    
+    def clear_results(self):
+        """Forget the last search's results, keeping the query and options."""
+        self.results_tree.clear()
+        self.results = []
+        self.file_results = {}
+        self._untitled_paths = set()
+        self.status_label.setText("Ready")
+    
     def _get_open_tabs(self):
         """Get all open tabs and their content."""
         files = []
-        all_tab_widgets = self.split_container.findChildren(type(self.split_container.active_tab_widget()))
-        
         seen_paths = set()
-        for tab_widget in all_tab_widgets:
-            for i in range(tab_widget.count()):
-                editor = tab_widget.widget(i)
-                if editor:
-                    file_path = editor.file_path or f"Untitled-{id(editor)}"
-                    if file_path not in seen_paths:
-                        seen_paths.add(file_path)
-                        content = editor.toPlainText()
-                        files.append((file_path, content))
+        for editor in self._iter_open_editors():
+            file_path = editor.file_path
+            if not file_path:
+                file_path = f"Untitled-{id(editor)}"
+                self._untitled_paths.add(file_path)
+            if file_path not in seen_paths:
+                seen_paths.add(file_path)
+                content = editor.toPlainText()
+                files.append((file_path, content))
         
         return files
     
@@ -221,24 +249,49 @@ class MultiFileFindDialog(QDialog):
             return []
         
         files = []
-        dir_path = Path(directory)
-        
-        # Common text file extensions
-        extensions = ['.txt', '.py', '.js', '.java', '.cpp', '.c', '.h', '.hpp',
-                     '.css', '.html', '.xml', '.json', '.md', '.rst', '.yaml', '.yml']
-        
-        for ext in extensions:
-            for file_path in dir_path.rglob(f'*{ext}'):
-                if file_path.is_file():
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        files.append((str(file_path), content))
-                    except (UnicodeDecodeError, OSError):
-                        pass
+        for file_path in self._iter_directory_files(directory):
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                files.append((file_path, content))
+            except (UnicodeDecodeError, OSError):
+                pass
         
         return files
     
+    def _iter_directory_files(self, directory: str):
+        """Yield the paths of searchable files below a directory."""
+        # DirEntry carries the name, full path and type from readdir, so
+        # no Path objects are built and no extra stat is needed per entry
+        pending = [directory]
+        while pending:
+            files = []
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append((entry.name.lower(), entry.path))
+                            elif self._is_supported_file(entry.name) and entry.is_file():
+                                files.append((entry.name.lower(), entry.path))
+                        except OSError:
+                            pass
+            except OSError:
+                continue
+            
+            # Keys are built during the scan, so sorting compares plain tuples;
+            # a directory's files come first, then its subdirectories in order
+            files.sort()
+            for _, path in files:
+                yield path
+            subdirs.sort(reverse=True)
+            pending.extend(path for _, path in subdirs)
+    
+    def _is_supported_file(self, name: str) -> bool:
+        """Check if a file name has a searchable extension."""
+        return name.lower().endswith(self._SUPPORTED_SUFFIXES)
+    
     def _search_in_text(self, text: str, search_text: str, file_path: str):
         """Search for text in the given content."""
         results = []
@@ -281,41 +334,85 @@ class MultiFileFindDialog(QDialog):
     
     def _display_results(self):
         """Display search results in the tree widget."""
+        file_items = []
+        expanded_items = []
+        budget = self.EAGER_RESULT_LIMIT
         for file_path, matches in self.file_results.items():
-            # Create parent item for file
-            file_item = QTreeWidgetItem(self.results_tree)
-            file_item.setText(0, str(Path(file_path).name) if Path(file_path).exists() else file_path)
+            # Create parent item for file; inserted into the tree in one batch below
+            file_item = QTreeWidgetItem()
+            # Untitled placeholders are known from collection, so no stat per file
+            if file_path in self._untitled_paths:
+                file_item.setText(0, file_path)
+            else:
+                file_item.setText(0, os.path.basename(file_path))
             file_item.setToolTip(0, file_path)
             file_item.setText(1, f"({len(matches)})")
+            file_item.setData(0, Qt.ItemDataRole.UserRole, file_path)
             
-            # Add child items for each match
-            for result in matches:
-                match_item = QTreeWidgetItem(file_item)
-                match_item.setText(0, "")
-                match_item.setText(1, str(result.line_number))
-                match_item.setText(2, result.line_text)
-                match_item.setData(0, Qt.ItemDataRole.UserRole, result)
-        
-        self.results_tree.expandAll()
+            if budget > 0:
+                self._add_match_items(file_item, matches)
+                budget -= file_item.childCount()
+                expanded_items.append(file_item)
+            else:
+                file_item.setChildIndicatorPolicy(
+                    QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+                )
+            file_items.append(file_item)
+        
+        self.results_tree.setUpdatesEnabled(False)
+        self.results_tree.blockSignals(True)
+        try:
+            self.results_tree.addTopLevelItems(file_items)
+            for file_item in expanded_items:
+                file_item.setExpanded(True)
+        finally:
+            self.results_tree.blockSignals(False)
+            self.results_tree.setUpdatesEnabled(True)
+    
+    def _add_match_items(self, file_item: QTreeWidgetItem, matches: list, start: int = 0):
+        """Add one page of match items under a file item."""
+        end = start + self.MAX_RESULTS_PER_FILE
+        # Items are built detached and inserted with a single addChildren call
+        items = []
+        for result in matches[start:end]:
+            match_item = QTreeWidgetItem(["", str(result.line_number), result.line_text])
+            match_item.setData(0, Qt.ItemDataRole.UserRole, result)
+            items.append(match_item)
+        
+        # Defer the rest behind an item that loads the next page on double-click
+        remaining = len(matches) - end
+        if remaining > 0:
+            more_item = QTreeWidgetItem(["", "", f"… {remaining} more"])
+            more_item.setData(0, Qt.ItemDataRole.UserRole, (matches[0].file_path, end))
+            items.append(more_item)
+        
+        file_item.addChildren(items)
+    
+    def _on_result_expanded(self, item: QTreeWidgetItem):
+        """Build the match items of a file the first time it is expanded."""
+        file_path = item.data(0, Qt.ItemDataRole.UserRole)
+        if item.childCount() == 0 and file_path in self.file_results:
+            self._add_match_items(item, self.file_results[file_path])
     
     def _on_result_double_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle double-click on a result to jump to location."""
         result = item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(result, tuple):
+            file_path, start = result
+            file_item = item.parent()
+            file_item.removeChild(item)
+            self._add_match_items(file_item, self.file_results[file_path], start)
+            return
         if not isinstance(result, SearchResult):
             return
         
-        # Try to find and open the file in the editor
-        all_tab_widgets = self.split_container.findChildren(type(self.split_container.active_tab_widget()))
-        
         # First, check if file is already open
-        for tab_widget in all_tab_widgets:
-            for i in range(tab_widget.count()):
-                editor = tab_widget.widget(i)
-                if editor and editor.file_path == result.file_path:
-                    tab_widget.setCurrentIndex(i)
-                    editor.go_to_line(result.line_number)
-                    editor.setFocus()
-                    return
+        tab_widget, editor = self.split_container.find_editor(result.file_path)
+        if editor:
+            tab_widget.set_current_editor(editor)
+            editor.go_to_line(result.line_number)
+            editor.setFocus()
+            return
         
         # If not open, try to open it
         if Path(result.file_path).exists():
@@ -383,8 +480,10 @@ class MultiFileFindDialog(QDialog):
                 # Replace in open editor
                 text = editor.toPlainText()
                 new_text = self._replace_in_text(text, results, search_text, replacement)
-                editor.setPlainText(new_text)
-                editor.set_modified(True)
+                # An undoable edit instead of setPlainText, which would also
+                # drop the undo history; nothing is rebuilt if no text changed
+                if new_text != text:
+                    editor.replace_text(new_text)
                 count += len(results)
             elif Path(file_path).exists():
                 # Replace in file on disk
@@ -394,8 +493,9 @@ class MultiFileFindDialog(QDialog):
                     
                     new_text = self._replace_in_text(text, results, search_text, replacement)
                     
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(new_text)
+                    if new_text != text:
+                        with open(file_path, 'w', encoding='utf-8') as f:
+                            f.write(new_text)
                     
                     count += len(results)
                 except (OSError, IOError) as e:
@@ -432,12 +532,4 @@ class MultiFileFindDialog(QDialog):
     
     def _find_editor_for_file(self, file_path: str):
         """Find an open editor for the given file path."""
-        all_tab_widgets = self.split_container.findChildren(type(self.split_container.active_tab_widget()))
-        
-        for tab_widget in all_tab_widgets:
-            for i in range(tab_widget.count()):
-                editor = tab_widget.widget(i)
-                if editor and editor.file_path == file_path:
-                    return editor
-        
-        return None
+        return self.split_container.find_editor(file_path)[1]
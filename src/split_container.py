@@ -1,10 +1,20 @@
 """Split view container for side-by-side editing."""
 
 from PyQt6.QtWidgets import QSplitter, QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 
 from .tab_widget import EditorTabWidget
 
+# Applied once to the container; every splitter below it inherits the rules
+_SPLITTER_QSS = """
+    QSplitter::handle {
+        background-color: #555;
+    }
+    QSplitter::handle:hover {
+        background-color: #0078d4;
+    }
+"""
+
 
 class SplitContainer(QWidget):
     """Container that manages split views of editor tabs."""
@@ -15,7 +25,9 @@ class SplitContainer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._active_tabs = None
-        self._closing = False
+        # Panes in visual (depth-first) order, and each pane's position
+        self._tab_widgets = []
+        self._tab_order_index = {}
         self._setup_ui()
     
     def _setup_ui(self):
@@ -23,18 +35,11 @@ class SplitContainer(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
+        self.setStyleSheet(_SPLITTER_QSS)
         
         self.root_splitter = QSplitter(Qt.Orientation.Horizontal)
         # Make the splitter handle more visible and easier to grab
         self.root_splitter.setHandleWidth(4)
-        self.root_splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #555;
-            }
-            QSplitter::handle:hover {
-                background-color: #0078d4;
-            }
-        """)
         layout.addWidget(self.root_splitter)
         
         initial_tabs = self._create_tab_widget()
@@ -45,42 +50,48 @@ class SplitContainer(QWidget):
         """Create a new tab widget with connected signals."""
         tabs = EditorTabWidget()
         tabs.current_editor_changed.connect(self._on_editor_changed)
-        tabs.all_tabs_closed.connect(lambda: self._on_all_tabs_closed(tabs))
-        
-        tabs.focusInEvent = lambda e, t=tabs: self._on_tabs_focused(t, e)
+        tabs.all_tabs_closed.connect(self._on_child_all_tabs_closed)
+        tabs.focused.connect(self._set_active_tabs)
         
+        # New panes are placed right after the pane being split
+        if self._active_tabs in self._tab_order_index:
+            position = self._tab_order_index[self._active_tabs] + 1
+        else:
+            position = len(self._tab_widgets)
+        self._tab_widgets.insert(position, tabs)
+        self._reindex_tab_widgets()
         return tabs
     
-    def _on_tabs_focused(self, tabs: EditorTabWidget, event):
-        """Handle focus change to a tab widget."""
-        QWidget.focusInEvent(tabs, event)
-        self._set_active_tabs(tabs)
+    def _reindex_tab_widgets(self):
+        """Rebuild the pane to position lookup."""
+        self._tab_order_index = {tabs: i for i, tabs in enumerate(self._tab_widgets)}
     
+    @pyqtSlot(object)
     def _set_active_tabs(self, tabs: EditorTabWidget):
         """Set the active tab widget."""
         if self._active_tabs == tabs:
             return
         
-        if self._active_tabs:
-            self._active_tabs.setStyleSheet("")
-        
         self._active_tabs = tabs
         self.active_tabs_changed.emit(tabs)
         
         if tabs and tabs.current_editor():
             self.current_editor_changed.emit(tabs.current_editor())
     
+    @pyqtSlot(object)
     def _on_editor_changed(self, editor):
         """Handle editor change in any tab widget."""
         sender = self.sender()
         if sender == self._active_tabs:
             self.current_editor_changed.emit(editor)
     
+    @pyqtSlot()
+    def _on_child_all_tabs_closed(self):
+        """Route a pane's all_tabs_closed signal to _on_all_tabs_closed."""
+        self._on_all_tabs_closed(self.sender())
+    
     def _on_all_tabs_closed(self, tabs: EditorTabWidget):
         """Handle when all tabs in a widget are closed."""
-        if self._closing:
-            return
-        
         all_tab_widgets = self._get_all_tab_widgets()
         
         if len(all_tab_widgets) == 1:
@@ -91,11 +102,12 @@ class SplitContainer(QWidget):
     
     def _get_all_tab_widgets(self) -> list:
         """Get all tab widgets in the container."""
-        return self.findChildren(EditorTabWidget)
+        return self._tab_widgets
     
     def _remove_tab_widget(self, tabs: EditorTabWidget):
         """Remove a tab widget from the split."""
-        parent = tabs.parent()
+        self._tab_widgets.remove(tabs)
+        self._reindex_tab_widgets()
         tabs.setParent(None)
         tabs.deleteLater()
         
@@ -109,11 +121,22 @@ class SplitContainer(QWidget):
     
     def _cleanup_empty_splitters(self):
         """Remove empty splitters and simplify the tree."""
-        def cleanup(splitter):
+        # Post-order walk with an explicit stack: children are simplified
+        # before the splitter that holds them
+        stack = [(self.root_splitter, False)]
+        while stack:
+            splitter, visited = stack.pop()
+            if not visited:
+                stack.append((splitter, True))
+                for i in range(splitter.count()):
+                    widget = splitter.widget(i)
+                    if isinstance(widget, QSplitter):
+                        stack.append((widget, False))
+                continue
+            
             for i in range(splitter.count() - 1, -1, -1):
                 widget = splitter.widget(i)
                 if isinstance(widget, QSplitter):
-                    cleanup(widget)
                     if widget.count() == 0:
                         widget.setParent(None)
                         widget.deleteLater()
@@ -123,8 +146,6 @@ class SplitContainer(QWidget):
                         splitter.insertWidget(i, child)
                         widget.setParent(None)
                         widget.deleteLater()
-        
-        cleanup(self.root_splitter)
     
     def active_tab_widget(self) -> EditorTabWidget:
         """Get the currently active tab widget."""
@@ -149,36 +170,32 @@ class SplitContainer(QWidget):
         if not self._active_tabs:
             return
         
-        current_tabs = self._active_tabs
-        parent = current_tabs.parent()
-        
-        if isinstance(parent, QSplitter) and parent.orientation() == orientation:
-            new_tabs = self._create_tab_widget()
-            index = parent.indexOf(current_tabs)
-            parent.insertWidget(index + 1, new_tabs)
-            self._balance_splitter(parent)
-        else:
-            new_splitter = QSplitter(orientation)
-            # Style the new splitter
-            new_splitter.setHandleWidth(4)
-            new_splitter.setStyleSheet("""
-                QSplitter::handle {
-                    background-color: #555;
-                }
-                QSplitter::handle:hover {
-                    background-color: #0078d4;
-                }
-            """)
+        # Rebuild the tree behind a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            current_tabs = self._active_tabs
+            parent = current_tabs.parent()
             
-            if isinstance(parent, QSplitter):
+            if isinstance(parent, QSplitter) and parent.orientation() == orientation:
+                new_tabs = self._create_tab_widget()
                 index = parent.indexOf(current_tabs)
-                parent.insertWidget(index, new_splitter)
-            
-            new_splitter.addWidget(current_tabs)
-            
-            new_tabs = self._create_tab_widget()
-            new_splitter.addWidget(new_tabs)
-            self._balance_splitter(new_splitter)
+                parent.insertWidget(index + 1, new_tabs)
+                self._balance_splitter(parent)
+            else:
+                new_splitter = QSplitter(orientation)
+                new_splitter.setHandleWidth(4)
+                
+                if isinstance(parent, QSplitter):
+                    index = parent.indexOf(current_tabs)
+                    parent.insertWidget(index, new_splitter)
+                
+                new_splitter.addWidget(current_tabs)
+                
+                new_tabs = self._create_tab_widget()
+                new_splitter.addWidget(new_tabs)
+                self._balance_splitter(new_splitter)
+        finally:
+            self.setUpdatesEnabled(True)
         
         new_tabs.setFocus()
         self._set_active_tabs(new_tabs)
@@ -204,31 +221,32 @@ class SplitContainer(QWidget):
     
     def focus_next_split(self):
         """Focus the next split pane."""
-        all_tabs = self._get_all_tab_widgets()
-        if len(all_tabs) <= 1:
-            return
-        
-        try:
-            current_index = all_tabs.index(self._active_tabs)
-            next_index = (current_index + 1) % len(all_tabs)
-            all_tabs[next_index].setFocus()
-            self._set_active_tabs(all_tabs[next_index])
-        except ValueError:
-            pass
+        self._focus_split(1)
     
     def focus_previous_split(self):
         """Focus the previous split pane."""
-        all_tabs = self._get_all_tab_widgets()
+        self._focus_split(-1)
+    
+    def _focus_split(self, step: int):
+        """Focus the pane step positions away from the active one."""
+        all_tabs = self._tab_widgets
         if len(all_tabs) <= 1:
             return
         
-        try:
-            current_index = all_tabs.index(self._active_tabs)
-            prev_index = (current_index - 1) % len(all_tabs)
-            all_tabs[prev_index].setFocus()
-            self._set_active_tabs(all_tabs[prev_index])
-        except ValueError:
-            pass
+        current_index = self._tab_order_index.get(self._active_tabs)
+        if current_index is None:
+            return
+        target = all_tabs[(current_index + step) % len(all_tabs)]
+        target.setFocus()
+        self._set_active_tabs(target)
+    
+    def find_editor(self, file_path):
+        """Get the tab widget and editor showing a file, or (None, None)."""
+        for tabs in self._tab_widgets:
+            editor = tabs.editor_for_path(file_path)
+            if editor is not None:
+                return tabs, editor
+        return None, None
     
     def new_tab(self, file_path=None):
         """Create a new tab in the active tab widget."""
@@ -262,15 +280,20 @@ class SplitContainer(QWidget):
     
     def close_all_tabs(self) -> bool:
         """Close all tabs in all tab widgets."""
-        self._closing = True
+        # Save prompts need the panes painted, and a pane cannot repaint
+        # while the container has updates off, so only batch without them
+        batch = not any(tabs.has_unsaved_changes() for tabs in self._tab_widgets)
+        if batch:
+            self.setUpdatesEnabled(False)
         try:
-            for tabs in self._get_all_tab_widgets():
-                if not tabs.close_all_tabs():
-                    self._closing = False
+            # Panes stay in place while emptied, so no all_tabs_closed handling
+            for tabs in list(self._tab_widgets):
+                if not tabs.close_all_tabs(notify=False):
                     return False
             return True
         finally:
-            self._closing = False
+            if batch:
+                self.setUpdatesEnabled(True)
     
     def next_tab(self):
         """Switch to next tab in active tab widget."""
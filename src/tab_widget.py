@@ -1,8 +1,7 @@
 """Tab widget for multi-file support."""
 
 from PyQt6.QtWidgets import QTabWidget, QTabBar, QMessageBox, QFileDialog
-from PyQt6.QtCore import Qt, pyqtSignal
-from pathlib import Path
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 
 from .editor import TextEditor
 
@@ -12,34 +11,98 @@ class EditorTabWidget(QTabWidget):
     
     current_editor_changed = pyqtSignal(object)
     all_tabs_closed = pyqtSignal()
+    focused = pyqtSignal(object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTabsClosable(True)
         self.setMovable(True)
         self.setDocumentMode(True)
+        # Fixed layout policy so retitling a tab does not refit every tab
+        bar = self.tabBar()
+        bar.setElideMode(Qt.TextElideMode.ElideRight)
+        bar.setExpanding(False)
+        bar.setUsesScrollButtons(True)
+        bar.tabMoved.connect(self._on_tab_moved)
+        self._path_to_editor = {}
+        self._editor_to_index = {}
+        self._last_current_editor = None
+        
+        # Title refreshes from modification_changed run once per event-loop pass
+        self._pending_titles = set()
+        self._title_timer = QTimer(self)
+        self._title_timer.setSingleShot(True)
+        self._title_timer.setInterval(0)
+        self._title_timer.timeout.connect(self._flush_title_updates)
         
         self.tabCloseRequested.connect(self.close_tab)
         self.currentChanged.connect(self._on_current_changed)
         
         self.new_tab()
     
+    @pyqtSlot(int)
     def _on_current_changed(self, index):
         """Handle tab change."""
         editor = self.widget(index)
+        # Removing a tab before the current one shifts the index, not the editor
+        if editor is self._last_current_editor:
+            return
+        self._last_current_editor = editor
         self.current_editor_changed.emit(editor)
     
+    def focusInEvent(self, event):
+        """Announce that this tab widget received focus."""
+        super().focusInEvent(event)
+        self.focused.emit(self)
+    
+    def tabInserted(self, index):
+        """Shift cached indices for the inserted tab and those after it."""
+        super().tabInserted(index)
+        self._reindex(index, self.count())
+    
+    def tabRemoved(self, index):
+        """Rebuild cached indices without the removed tab."""
+        super().tabRemoved(index)
+        self._editor_to_index = {}
+        self._reindex(0, self.count())
+    
+    @pyqtSlot(int, int)
+    def _on_tab_moved(self, from_index, to_index):
+        """Re-cache the indices between a dragged tab's old and new spot."""
+        self._reindex(min(from_index, to_index), max(from_index, to_index) + 1)
+    
+    def _reindex(self, start: int, stop: int):
+        """Cache the tab index of each editor in [start, stop)."""
+        cache = self._editor_to_index
+        for i in range(start, stop):
+            cache[self.widget(i)] = i
+    
+    def _index_of(self, editor: TextEditor) -> int:
+        """Return the tab index of an editor, or -1 if it is not a tab."""
+        index = self._editor_to_index.get(editor, -1)
+        if index == -1 or self.widget(index) is not editor:
+            return self.indexOf(editor)
+        return index
+    
     def current_editor(self) -> TextEditor:
         """Get the current editor."""
         return self.currentWidget()
     
+    def editor_for_path(self, file_path: str) -> TextEditor:
+        """Get the open editor for a file path, or None."""
+        return self._path_to_editor.get(file_path)
+    
+    def set_current_editor(self, editor: TextEditor):
+        """Switch to the tab showing an editor."""
+        self.setCurrentIndex(self._index_of(editor))
+    
     def new_tab(self, file_path: str = None) -> TextEditor:
         """Create a new editor tab."""
         editor = TextEditor()
         
         if file_path:
             if editor.load_file(file_path):
-                tab_name = Path(file_path).name
+                tab_name = editor.get_display_name()
             else:
                 QMessageBox.warning(
                     self, "Error", 
@@ -50,24 +113,38 @@ class EditorTabWidget(QTabWidget):
             tab_name = "Untitled"
         
         index = self.addTab(editor, tab_name)
+        self._track_file_path(editor)
         self.setCurrentIndex(index)
         
-        editor.modification_changed.connect(
-            lambda modified: self._update_tab_title(editor)
-        )
+        editor.modification_changed.connect(self._on_editor_modified)
         
         return editor
     
+    @pyqtSlot(bool)
+    def _on_editor_modified(self, modified):
+        """Queue a title refresh for the editor whose modified flag changed."""
+        self._pending_titles.add(self.sender())
+        if not self._title_timer.isActive():
+            self._title_timer.start()
+    
+    def _flush_title_updates(self):
+        """Refresh the titles of all editors queued since the last pass."""
+        pending = self._pending_titles
+        self._pending_titles = set()
+        for editor in pending:
+            self._update_tab_title(editor)
+    
     def _update_tab_title(self, editor: TextEditor):
         """Update tab title based on modification state."""
-        index = self.indexOf(editor)
+        index = self._index_of(editor)
         if index == -1:
             return
         
         name = editor.get_display_name()
         if editor.is_modified:
             name = f"● {name}"
-        self.setTabText(index, name)
+        if self.tabText(index) != name:
+            self.setTabText(index, name)
     
     def open_file(self, file_path: str = None) -> TextEditor:
         """Open a file in a new tab or switch to existing tab."""
@@ -78,22 +155,33 @@ class EditorTabWidget(QTabWidget):
             if not file_path:
                 return None
         
-        for i in range(self.count()):
-            editor = self.widget(i)
-            if editor.file_path == file_path:
-                self.setCurrentIndex(i)
-                return editor
+        existing = self._path_to_editor.get(file_path)
+        if existing is not None:
+            self.set_current_editor(existing)
+            return existing
         
         current = self.current_editor()
         if (current and not current.file_path and 
             not current.is_modified and 
-            not current.toPlainText()):
+            current.document().isEmpty()):
             if current.load_file(file_path):
+                self._track_file_path(current)
                 self._update_tab_title(current)
                 return current
         
         return self.new_tab(file_path)
     
+    def _track_file_path(self, editor: TextEditor, old_path: str = None):
+        """Record the editor under its current file path."""
+        self._untrack_file_path(old_path, editor)
+        if editor.file_path:
+            self._path_to_editor[editor.file_path] = editor
+    
+    def _untrack_file_path(self, file_path: str, editor: TextEditor):
+        """Forget a file path if it still points to the editor."""
+        if file_path and self._path_to_editor.get(file_path) is editor:
+            del self._path_to_editor[file_path]
+    
     def save_current(self) -> bool:
         """Save the current file."""
         editor = self.current_editor()
@@ -120,11 +208,14 @@ class EditorTabWidget(QTabWidget):
         if not file_path:
             return False
         
+        old_path = editor.file_path
         success = editor.save_file(file_path)
         if success:
+            self._track_file_path(editor, old_path)
             self._update_tab_title(editor)
         return success
     
+    @pyqtSlot(int, result=bool)
     def close_tab(self, index: int) -> bool:
         """Close a tab, prompting to save if modified."""
         editor = self.widget(index)
@@ -149,27 +240,47 @@ class EditorTabWidget(QTabWidget):
                     return False
         
         self.removeTab(index)
+        self._untrack_file_path(editor.file_path, editor)
         
         if self.count() == 0:
             self.all_tabs_closed.emit()
         
         return True
     
-    def close_all_tabs(self) -> bool:
-        """Close all tabs."""
-        while self.count() > 0:
-            if not self.close_tab(0):
-                return False
+    def close_all_tabs(self, notify: bool = True) -> bool:
+        """Close all tabs, emitting all_tabs_closed afterwards if notify is set."""
+        # Repaint and notify once at the end instead of once per removed tab;
+        # a modified tab is closed with updates on, since it may prompt
+        self.blockSignals(True)
+        try:
+            while self.count() > 0:
+                self.setUpdatesEnabled(self.widget(0).is_modified)
+                if not self.close_tab(0):
+                    break
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        
+        self._last_current_editor = self.current_editor()
+        self.current_editor_changed.emit(self._last_current_editor)
+        if self.count() > 0:
+            return False
+        if notify:
+            self.all_tabs_closed.emit()
         return True
     
+    def has_unsaved_changes(self) -> bool:
+        """Check whether any tab has unsaved changes."""
+        return any(self.widget(i).is_modified for i in range(self.count()))
+    
     def next_tab(self):
         """Switch to the next tab."""
-        if self.count() > 1:
-            next_index = (self.currentIndex() + 1) % self.count()
-            self.setCurrentIndex(next_index)
+        count = self.count()
+        if count > 1:
+            self.setCurrentIndex((self.currentIndex() + 1) % count)
     
     def previous_tab(self):
         """Switch to the previous tab."""
-        if self.count() > 1:
-            prev_index = (self.currentIndex() - 1) % self.count()
-            self.setCurrentIndex(prev_index)
+        count = self.count()
+        if count > 1:
+            self.setCurrentIndex((self.currentIndex() - 1) % count)
@@ -85,10 +85,71 @@ class TestFileOperations:
         finally:
             os.unlink(temp_path)
     
+    def test_load_file_signals_once(self, editor, tmp_path):
+        """Test that loading reports modification and cursor state once."""
+        path = tmp_path / "load.txt"
+        path.write_text("Line 1\nLine 2")
+        editor.setPlainText("Unsaved")
+        editor.set_modified(True)
+        
+        modified = []
+        positions = []
+        editor.modification_changed.connect(modified.append)
+        editor.cursor_position_changed.connect(lambda line, col: positions.append((line, col)))
+        
+        assert editor.load_file(str(path))
+        assert modified == [False]
+        assert positions == [(1, 1)]
+        assert not editor.is_modified
+    
     def test_load_nonexistent_file(self, editor):
         """Test loading a file that doesn't exist."""
         assert not editor.load_file("/nonexistent/path/file.txt")
     
+    def test_load_file_line_endings(self, editor, tmp_path):
+        """Test that CR-only and mixed line endings load as separate lines."""
+        path = tmp_path / "endings.txt"
+        path.write_bytes(b"line1\rline2\rline3")
+        assert editor.load_file(str(path))
+        assert editor.toPlainText() == "line1\nline2\nline3"
+        
+        path.write_bytes(b"a\r\nb\rc\n")
+        assert editor.load_file(str(path))
+        assert editor.toPlainText() == "a\nb\nc\n"
+    
+    def test_load_non_utf8_file(self, editor, tmp_path):
+        """Test that a file that is not valid UTF-8 is refused, not altered."""
+        path = tmp_path / "latin1.txt"
+        path.write_bytes(b"caf\xe9")
+        editor.setPlainText("Unsaved")
+        
+        assert not editor.load_file(str(path))
+        assert editor.toPlainText() == "Unsaved"
+        assert editor.file_path is None
+        assert path.read_bytes() == b"caf\xe9"
+    
+    @pytest.mark.skipif(
+        hasattr(os, "geteuid") and os.geteuid() == 0,
+        reason="root ignores directory permissions"
+    )
+    def test_save_in_read_only_directory(self, editor, tmp_path):
+        """Test saving a writable file whose directory is read-only."""
+        path = tmp_path / "file.txt"
+        path.write_text("old")
+        tmp_path.chmod(0o555)
+        try:
+            editor.setPlainText("new")
+            assert editor.save_file(str(path))
+            assert path.read_text() == "new"
+        finally:
+            tmp_path.chmod(0o755)
+    
+    def test_save_to_invalid_path(self, editor):
+        """Test saving into a directory that doesn't exist."""
+        editor.setPlainText("Test")
+        assert not editor.save_file("/nonexistent/path/file.txt")
+        assert editor.file_path is None
+    
     def test_save_without_path(self, editor):
         """Test saving without a path."""
         editor.setPlainText("Test")
@@ -124,6 +185,16 @@ class TestLineOperations:
         assert lines[0] == "Line 1"
         assert lines[1] == "Line 3"
     
+    def test_delete_last_line(self, editor):
+        """Test deleting the last line removes the newline before it."""
+        editor.setPlainText("Line 1\nLine 2")
+        cursor = editor.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        editor.setTextCursor(cursor)
+        
+        editor.delete_line()
+        assert editor.toPlainText() == "Line 1"
+    
     def test_move_line_down(self, editor):
         """Test moving line down."""
         editor.setPlainText("Line 1\nLine 2\nLine 3")
@@ -150,6 +221,24 @@ class TestLineOperations:
         assert lines[1] == "Line 1"
         assert lines[2] == "Line 3"
     
+    def test_move_line_keeps_column(self, editor):
+        """Test that moving a line keeps the cursor column."""
+        editor.setPlainText("Line 1\nLine 2\nLine 3")
+        cursor = editor.textCursor()
+        cursor.setPosition(3)
+        editor.setTextCursor(cursor)
+        
+        editor.move_line_down()
+        cursor = editor.textCursor()
+        assert cursor.blockNumber() == 1
+        assert cursor.positionInBlock() == 3
+        
+        editor.move_line_up()
+        cursor = editor.textCursor()
+        assert cursor.blockNumber() == 0
+        assert cursor.positionInBlock() == 3
+        assert editor.toPlainText() == "Line 1\nLine 2\nLine 3"
+    
     def test_move_first_line_up_noop(self, editor):
         """Test that moving the first line up does nothing."""
         editor.setPlainText("Line 1\nLine 2")
@@ -212,6 +301,34 @@ class TestNavigation:
         cursor = editor.textCursor()
         assert cursor.blockNumber() == 1
     
+    def test_go_to_line_after_edit(self, editor):
+        """Test go to line after lines were inserted."""
+        editor.setPlainText("Line 1\nLine 2\nLine 3")
+        editor.go_to_line(3)
+        
+        cursor = editor.textCursor()
+        cursor.setPosition(0)
+        cursor.insertText("New line\n")
+        editor.go_to_line(3)
+        
+        cursor = editor.textCursor()
+        assert cursor.blockNumber() == 2
+        assert cursor.block().text() == "Line 2"
+    
+    def test_cursor_position_reports_are_throttled(self, editor):
+        """Test that cursor moves are reported after a short delay."""
+        editor.setPlainText("Line 1\nLine 2")
+        positions = []
+        editor.cursor_position_changed.connect(lambda line, col: positions.append((line, col)))
+        
+        editor.go_to_line(2)
+        cursor = editor.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock)
+        editor.setTextCursor(cursor)
+        
+        assert positions == []
+        assert editor._cursor_timer.isActive()
+    
     def test_go_to_invalid_line(self, editor):
         """Test go to invalid line number."""
         editor.setPlainText("Line 1\nLine 2")
@@ -69,6 +69,34 @@ class TestFindFunctionality:
         assert find_replace.find_previous()
         assert editor.textCursor().selectedText() == "Hello"
     
+    def test_find_next_after_previous(self, editor, find_replace):
+        """Test alternating directions steps between neighbouring matches."""
+        editor.setPlainText("ab ab ab")
+        find_replace.find_input.setText("ab")
+        
+        find_replace.find_next()
+        find_replace.find_next()
+        assert editor.textCursor().position() == 5
+        
+        find_replace.find_previous()
+        assert editor.textCursor().position() == 2
+        
+        find_replace.find_next()
+        assert editor.textCursor().position() == 5
+    
+    def test_find_next_from_moved_cursor(self, editor, find_replace):
+        """Test that moving the cursor restarts the search from there."""
+        editor.setPlainText("ab ab ab")
+        find_replace.find_input.setText("ab")
+        find_replace.find_next()
+        
+        cursor = editor.textCursor()
+        cursor.setPosition(6)
+        editor.setTextCursor(cursor)
+        
+        find_replace.find_next()
+        assert editor.textCursor().position() == 8
+    
     def test_find_case_sensitive(self, editor, find_replace):
         """Test case sensitive search."""
         editor.setPlainText("Hello hello HELLO")
@@ -78,6 +106,16 @@ class TestFindFunctionality:
         assert find_replace.find_next()
         assert editor.textCursor().position() == 11
     
+    def test_find_after_unchecking_case_sensitive(self, editor, find_replace):
+        """Test that find follows the case option after it is toggled off."""
+        editor.setPlainText("Hello hello HELLO")
+        find_replace.find_input.setText("HELLO")
+        find_replace.case_sensitive_cb.setChecked(True)
+        find_replace.case_sensitive_cb.setChecked(False)
+        
+        assert find_replace.find_next()
+        assert editor.textCursor().position() == 5
+    
     def test_find_whole_word(self, editor, find_replace):
         """Test whole word search."""
         editor.setPlainText("Hello HelloWorld Hello")
@@ -93,6 +131,48 @@ class TestFindFunctionality:
         assert first_pos == 5
         assert second_pos == 22
     
+    def test_find_whole_word_matches_count(self, editor, find_replace):
+        """Test that whole word find treats underscores like the match count."""
+        editor.setPlainText("Foo foo_bar FOO")
+        find_replace.find_input.setText("foo")
+        find_replace.whole_word_cb.setChecked(True)
+        
+        positions = []
+        for _ in range(3):
+            find_replace.find_next()
+            positions.append(editor.textCursor().position())
+        find_replace._update_match_count()
+        
+        assert positions == [3, 7, 15]
+        assert find_replace.match_label.text() == "3 matches"
+    
+    def test_find_whole_word_case_sensitive_underscore(self, editor, find_replace):
+        """Test that case sensitive whole word find and count agree on underscores."""
+        editor.setPlainText("foo foo_bar foo")
+        find_replace.find_input.setText("foo")
+        find_replace.whole_word_cb.setChecked(True)
+        find_replace.case_sensitive_cb.setChecked(True)
+        
+        positions = []
+        for _ in range(3):
+            find_replace.find_next()
+            positions.append(editor.textCursor().position())
+        find_replace._update_match_count()
+        
+        assert positions == [3, 7, 15]
+        assert find_replace.match_label.text() == "3 matches"
+        find_replace.replace_input.setText("x")
+        assert find_replace.replace_all() == 3
+        assert editor.toPlainText() == "x x_bar x"
+    
+    def test_find_special_characters(self, editor, find_replace):
+        """Test that regex metacharacters in the search text match literally."""
+        editor.setPlainText("AXB a.b")
+        find_replace.find_input.setText("A.B")
+        
+        assert find_replace.find_next()
+        assert editor.textCursor().selectedText() == "a.b"
+    
     def test_find_no_match(self, editor, find_replace):
         """Test find with no match."""
         editor.setPlainText("Hello World")
@@ -108,6 +188,47 @@ class TestFindFunctionality:
         assert not find_replace.find_next()
 
 
+class TestMatchCount:
+    """Test the match count label."""
+    
+    def test_match_count_case_insensitive(self, editor, find_replace):
+        """Test counting ignores case by default."""
+        editor.setPlainText("Hello hello HELLO")
+        find_replace.find_input.setText("hello")
+        find_replace._update_match_count()
+        
+        assert find_replace.match_label.text() == "3 matches"
+    
+    def test_match_count_case_sensitive(self, editor, find_replace):
+        """Test case sensitive counting."""
+        editor.setPlainText("Hello hello HELLO")
+        find_replace.find_input.setText("hello")
+        find_replace.case_sensitive_cb.setChecked(True)
+        find_replace._update_match_count()
+        
+        assert find_replace.match_label.text() == "1 matches"
+    
+    def test_match_count_whole_word(self, editor, find_replace):
+        """Test whole word counting."""
+        editor.setPlainText("Hello HelloWorld Hello")
+        find_replace.find_input.setText("Hello")
+        find_replace.whole_word_cb.setChecked(True)
+        find_replace._update_match_count()
+        
+        assert find_replace.match_label.text() == "2 matches"
+    
+    def test_match_count_after_edit(self, editor, find_replace):
+        """Test that the count reflects edits made after a search."""
+        editor.setPlainText("Hello World")
+        find_replace.find_input.setText("Hello")
+        find_replace._update_match_count()
+        assert find_replace.match_label.text() == "1 matches"
+        
+        editor.textCursor().insertText("Hello ")
+        find_replace._update_match_count()
+        assert find_replace.match_label.text() == "2 matches"
+
+
 class TestReplaceFunctionality:
     """Test replace functionality."""
     
@@ -145,6 +266,43 @@ class TestReplaceFunctionality:
         assert count == 1
         assert editor.toPlainText() == "Hello hi HELLO"
     
+    def test_replace_all_whole_word(self, editor, find_replace):
+        """Test whole word replace all keeps partial matches."""
+        editor.setPlainText("Hello HelloWorld Hello")
+        find_replace.find_input.setText("hello")
+        find_replace.replace_input.setText("Hi\\1")
+        find_replace.whole_word_cb.setChecked(True)
+        
+        count = find_replace.replace_all()
+        
+        assert count == 2
+        assert editor.toPlainText() == "Hi\\1 HelloWorld Hi\\1"
+    
+    def test_replace_all_counts_new_matches(self, editor, find_replace):
+        """Test that the match count reflects the text after replace all."""
+        editor.setPlainText("a b a")
+        find_replace.find_input.setText("a")
+        find_replace.replace_input.setText("aa")
+        
+        find_replace.replace_all()
+        
+        assert find_replace.match_label.text() == "4 matches"
+        editor.setPlainText("a")
+        find_replace._update_match_count()
+        assert find_replace.match_label.text() == "1 matches"
+    
+    def test_replace_all_single_undo(self, editor, find_replace):
+        """Test that replace all is undone in one step."""
+        editor.setPlainText("a b a b a")
+        find_replace.find_input.setText("a")
+        find_replace.replace_input.setText("c")
+        
+        find_replace.replace_all()
+        assert editor.toPlainText() == "c b c b c"
+        
+        editor.undo()
+        assert editor.toPlainText() == "a b a b a"
+    
     def test_replace_empty_replacement(self, editor, find_replace):
         """Test replacing with empty string (deletion)."""
         editor.setPlainText("Hello World")
@@ -186,3 +344,16 @@ class TestFindReplaceUI:
         find_replace.show_find()
         
         assert find_replace.find_input.text() == "Hello"
+    
+    def test_search_text_change_is_debounced(self, editor, find_replace):
+        """Test that typing defers counting and finding the first match."""
+        editor.setPlainText("Hello World Hello")
+        find_replace.find_input.setText("Hello")
+        
+        assert find_replace._search_timer.isActive()
+        assert find_replace.match_label.text() == ""
+        
+        find_replace._on_search_settled()
+        
+        assert find_replace.match_label.text() == "2 matches"
+        assert editor.textCursor().position() == 5
@@ -113,6 +113,14 @@ def test_is_whole_word(dialog):
     assert dialog._is_whole_word(text2, 1, 3) is False  # "est"
 
 
+def test_is_supported_file(dialog):
+    """Test extension filtering for directory search."""
+    assert dialog._is_supported_file("script.py") is True
+    assert dialog._is_supported_file("README.MD") is True
+    assert dialog._is_supported_file("image.png") is False
+    assert dialog._is_supported_file("Makefile") is False
+
+
 def test_get_open_tabs(dialog, main_window):
     """Test getting open tabs."""
     # Create some tabs with content
@@ -127,6 +135,17 @@ def test_get_open_tabs(dialog, main_window):
     assert len(files) >= 2
 
 
+def test_get_open_tabs_across_splits(dialog, main_window):
+    """Test that open tabs are collected from every split pane."""
+    container = main_window.split_container
+    container.current_editor().setPlainText("Left")
+    container.split_horizontal()
+    container.current_editor().setPlainText("Right")
+    
+    contents = sorted(content for _, content in dialog._get_open_tabs())
+    assert contents == ["Left", "Right"]
+
+
 def test_replace_in_text_simple(dialog):
     """Test simple text replacement."""
     text = "Hello world\nHello again"
@@ -166,6 +185,39 @@ def test_find_editor_for_file(dialog, main_window, tmp_path):
     assert found_editor is editor
 
 
+def test_find_editor_in_other_split(dialog, main_window, tmp_path):
+    """Test finding an open editor that is not in the active split."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("Test content")
+    container = main_window.split_container
+    first_tabs = container.active_tab_widget()
+    editor = container.open_file(str(test_file))
+    
+    container.split_horizontal()
+    
+    assert container.active_tab_widget() is not first_tabs
+    assert container.find_editor(str(test_file)) == (first_tabs, editor)
+    assert container.find_editor(str(tmp_path / "missing.txt")) == (None, None)
+
+
+def test_replace_in_open_editor_is_undoable(dialog, main_window, tmp_path):
+    """Test that replacing in an open tab marks it modified and can be undone."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("old text old")
+    editor = main_window.split_container.open_file(str(test_file))
+    dialog.find_input.setText("old")
+    dialog.find_all()
+    
+    count = dialog._perform_replacements(dialog.file_results, "old", "new")
+    
+    assert count == 2
+    assert editor.toPlainText() == "new text new"
+    assert editor.is_modified
+    assert test_file.read_text() == "old text old"
+    editor.undo()
+    assert editor.toPlainText() == "old text old"
+
+
 def test_search_no_matches(dialog):
     """Test search with no matches."""
     text = "Hello world"
@@ -209,3 +261,121 @@ def test_replace_with_empty_text(dialog):
     
     new_text = dialog._replace_in_text(text, results, "world", "")
     assert new_text == "Hello "
+
+
+def test_reopened_dialog_starts_without_results(main_window, monkeypatch):
+    """Test that reopening Find in Files drops results from the last search."""
+    monkeypatch.setattr(MultiFileFindDialog, "exec", lambda self: 0)
+    main_window.split_container.current_editor().setPlainText("needle")
+    main_window._show_multi_file_find()
+    dlg = main_window._mf_dialog
+    dlg.find_input.setText("needle")
+    dlg.find_all()
+    assert dlg.results
+    
+    main_window._show_multi_file_find()
+    
+    assert main_window._mf_dialog is dlg
+    assert dlg.results == []
+    assert dlg.file_results == {}
+    assert dlg.results_tree.topLevelItemCount() == 0
+    assert dlg.status_label.text() == "Ready"
+    assert dlg.find_input.text() == "needle"
+
+
+def test_get_directory_files(dialog, tmp_path):
+    """Test collecting supported files from a directory tree."""
+    (tmp_path / "top.py").write_text("print('top')")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "notes.md").write_text("# Notes")
+    
+    dialog.directory_input.setText(str(tmp_path))
+    files = dict(dialog._get_directory_files())
+    
+    assert files == {
+        str(tmp_path / "top.py"): "print('top')",
+        str(nested / "notes.md"): "# Notes",
+    }
+
+
+def test_find_all_populates_results(dialog, main_window):
+    """Test that find all groups matches under one item per file."""
+    main_window.split_container.current_editor().setPlainText("needle\nhay\nneedle")
+    main_window.split_container.new_tab()
+    main_window.split_container.current_editor().setPlainText("needle")
+    
+    dialog.find_input.setText("needle")
+    dialog.find_all()
+    
+    tree = dialog.results_tree
+    assert tree.topLevelItemCount() == 2
+    assert sorted(tree.topLevelItem(i).childCount() for i in range(2)) == [1, 2]
+    assert dialog.status_label.text() == "Found 3 matches in 2 files"
+
+
+def test_result_file_labels(dialog, main_window, tmp_path):
+    """Test that saved files show their name and untitled tabs their placeholder."""
+    (tmp_path / "saved.txt").write_text("needle")
+    main_window.split_container.open_file(str(tmp_path / "saved.txt"))
+    main_window.split_container.new_tab()
+    main_window.split_container.current_editor().setPlainText("needle")
+    
+    dialog.find_input.setText("needle")
+    dialog.find_all()
+    
+    tree = dialog.results_tree
+    labels = sorted(tree.topLevelItem(i).text(0) for i in range(tree.topLevelItemCount()))
+    assert labels[0].startswith("Untitled-")
+    assert labels[1] == "saved.txt"
+
+
+def test_results_are_paged_per_file(dialog, main_window):
+    """Test that long result lists load in pages."""
+    main_window.split_container.current_editor().setPlainText("x\n" * 5)
+    dialog.MAX_RESULTS_PER_FILE = 2
+    dialog.find_input.setText("x")
+    dialog.find_all()
+    
+    file_item = dialog.results_tree.topLevelItem(0)
+    assert file_item.childCount() == 3
+    more_item = file_item.child(2)
+    assert more_item.text(2) == "… 3 more"
+    
+    dialog._on_result_double_clicked(more_item, 0)
+    assert file_item.childCount() == 5
+    assert file_item.child(4).text(2) == "… 1 more"
+
+
+def test_results_past_limit_load_on_expand(dialog, main_window):
+    """Test that files past the eager limit get their items when expanded."""
+    main_window.split_container.current_editor().setPlainText("x\nx")
+    main_window.split_container.new_tab()
+    main_window.split_container.current_editor().setPlainText("x")
+    dialog.EAGER_RESULT_LIMIT = 2
+    dialog.find_input.setText("x")
+    dialog.find_all()
+    
+    first, second = (dialog.results_tree.topLevelItem(i) for i in range(2))
+    assert first.isExpanded() and first.childCount() == 2
+    assert not second.isExpanded() and second.childCount() == 0
+    
+    second.setExpanded(True)
+    assert second.childCount() == 1
+
+
+def test_get_directory_files_sorted(dialog, tmp_path):
+    """Test that directory results come back in a stable order."""
+    for name in ("b.txt", "A.txt", "sub/z.txt", "sub/deeper/y.txt", "other/x.txt"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    
+    dialog.directory_input.setText(str(tmp_path))
+    names = [
+        str(Path(path).relative_to(tmp_path))
+        for path, _ in dialog._get_directory_files()
+    ]
+    
+    assert names == ["A.txt", "b.txt", "other/x.txt", "sub/z.txt", "sub/deeper/y.txt"]
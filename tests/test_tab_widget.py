@@ -0,0 +1,158 @@
+"""Tests for the EditorTabWidget."""
+
+import pytest
+
+from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
+
+from src.split_container import SplitContainer
+from src.tab_widget import EditorTabWidget
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create a QApplication instance for the test session."""
+    application = QApplication.instance()
+    if application is None:
+        application = QApplication([])
+    yield application
+
+
+@pytest.fixture
+def tabs(app):
+    """Create an EditorTabWidget with three tabs."""
+    widget = EditorTabWidget()
+    widget.new_tab()
+    widget.new_tab()
+    yield widget
+    widget.deleteLater()
+
+
+def editors(tabs):
+    """Get the editors of all tabs in order."""
+    return [tabs.widget(i) for i in range(tabs.count())]
+
+
+def assert_index_cache(tabs):
+    """Check the cached tab index of every editor against Qt's."""
+    for editor in editors(tabs):
+        assert tabs._editor_to_index[editor] == tabs.indexOf(editor)
+        assert tabs._index_of(editor) == tabs.indexOf(editor)
+
+
+class TestTabIndexCache:
+    """Test the cached editor-to-index mapping."""
+    
+    def test_move_tab(self, tabs):
+        """Test that dragging a tab re-caches the indices it shifted."""
+        first, second, third = editors(tabs)
+        
+        tabs.tabBar().moveTab(0, 2)
+        
+        assert editors(tabs) == [second, third, first]
+        assert_index_cache(tabs)
+    
+    def test_close_middle_tab(self, tabs):
+        """Test that closing a middle tab shifts the later indices."""
+        first, second, third = editors(tabs)
+        
+        assert tabs.close_tab(1)
+        
+        assert editors(tabs) == [first, third]
+        assert second not in tabs._editor_to_index
+        assert_index_cache(tabs)
+    
+    def test_title_update_after_move(self, tabs):
+        """Test that a modified tab is retitled at its new position."""
+        first = tabs.widget(0)
+        tabs.tabBar().moveTab(0, 2)
+        
+        first.set_modified(True)
+        tabs._flush_title_updates()
+        
+        assert tabs.tabText(2) == "● Untitled"
+        assert tabs.tabText(0) == "Untitled"
+        assert_index_cache(tabs)
+
+
+class TestPathIndex:
+    """Test the file path to editor mapping."""
+    
+    def test_save_as_moves_path(self, tabs, tmp_path, monkeypatch):
+        """Test that Save As re-keys the editor under its new path."""
+        old_path = tmp_path / "old.txt"
+        new_path = tmp_path / "new.txt"
+        old_path.write_text("content")
+        editor = tabs.open_file(str(old_path))
+        monkeypatch.setattr(
+            QFileDialog, "getSaveFileName",
+            staticmethod(lambda *args, **kwargs: (str(new_path), ""))
+        )
+        
+        assert tabs.save_current_as()
+        
+        assert tabs.editor_for_path(str(new_path)) is editor
+        assert tabs.editor_for_path(str(old_path)) is None
+    
+    def test_close_tab_drops_path(self, tabs, tmp_path):
+        """Test that closing a tab forgets its file path."""
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+        editor = tabs.open_file(str(path))
+        
+        assert tabs.close_tab(tabs.indexOf(editor))
+        
+        assert tabs.editor_for_path(str(path)) is None
+    
+    def test_reopen_closed_path(self, tabs, tmp_path):
+        """Test that reopening a closed file makes a new tab, not the old editor."""
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+        editor = tabs.open_file(str(path))
+        tabs.close_tab(tabs.indexOf(editor))
+        tabs.current_editor().setPlainText("Unsaved")
+        tabs.current_editor().set_modified(False)
+        count = tabs.count()
+        
+        reopened = tabs.open_file(str(path))
+        
+        assert reopened is not editor
+        assert tabs.count() == count + 1
+        assert tabs.indexOf(reopened) != -1
+        assert tabs.editor_for_path(str(path)) is reopened
+
+
+class TestCloseAllTabs:
+    """Test closing every tab at once."""
+    
+    def test_prompt_with_updates_enabled(self, tabs, monkeypatch):
+        """Test that the save prompt appears while the pane still repaints."""
+        tabs.widget(1).set_modified(True)
+        painting = []
+        
+        def question(*args, **kwargs):
+            painting.append(tabs.updatesEnabled())
+            return QMessageBox.StandardButton.Discard
+        monkeypatch.setattr(QMessageBox, "question", staticmethod(question))
+        
+        assert tabs.close_all_tabs(notify=False)
+        
+        assert painting == [True]
+        assert tabs.count() == 0
+        assert tabs.updatesEnabled()
+    
+    def test_container_prompt_with_updates_enabled(self, app, monkeypatch):
+        """Test that closing the whole container prompts with panes repainting."""
+        container = SplitContainer()
+        container.split_horizontal()
+        container.current_editor().set_modified(True)
+        painting = []
+        
+        def question(*args, **kwargs):
+            painting.append(container.active_tab_widget().updatesEnabled())
+            return QMessageBox.StandardButton.Discard
+        monkeypatch.setattr(QMessageBox, "question", staticmethod(question))
+        
+        assert container.close_all_tabs()
+        
+        assert painting == [True]
+        container.deleteLater()